@@ -22,11 +22,20 @@ from synergykit.schema import (
     IntegrationCostCategory,
     RevenueSynergyCategory,
 )
+from synergykit.sensitivity import sensitivity_grid
 
 # ── Page config ──────────────────────────────────────────────────────────────
 
 st.set_page_config(page_title="SynergyKit", page_icon=":chart_with_upwards_trend:", layout="wide")
-db.init_db()
+
+
+@st.cache_resource
+def _init_db() -> None:
+    """Create the schema and open the shared connection once per server process."""
+    db.init_db()
+
+
+_init_db()
 
 # ── Constants ────────────────────────────────────────────────────────────────
 
@@ -49,51 +58,143 @@ RAMP_PRESETS: dict[str, dict] = {
     },
 }
 
+LIBRARY_PAGE_SIZE = 100
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
 def _empty_cost_df() -> pd.DataFrame:
-    return pd.DataFrame(
-        {"category": pd.Series(dtype="object"),
-         "description": pd.Series(dtype="object"),
-         "run_rate": pd.Series(dtype="float64")}
-    )
+    return pd.DataFrame({
+        "category": np.empty(0, dtype=object),
+        "description": np.empty(0, dtype=object),
+        "run_rate": np.empty(0, dtype=np.float64),
+    })
 
 
 def _empty_rev_df() -> pd.DataFrame:
-    return pd.DataFrame(
-        {"category": pd.Series(dtype="object"),
-         "description": pd.Series(dtype="object"),
-         "run_rate": pd.Series(dtype="float64")}
-    )
+    return pd.DataFrame({
+        "category": np.empty(0, dtype=object),
+        "description": np.empty(0, dtype=object),
+        "run_rate": np.empty(0, dtype=np.float64),
+    })
 
 
 def _empty_int_df() -> pd.DataFrame:
-    return pd.DataFrame(
-        {"category": pd.Series(dtype="object"),
-         "description": pd.Series(dtype="object"),
-         "amount": pd.Series(dtype="float64"),
-         "year": pd.Series(dtype="float64")}
-    )
+    return pd.DataFrame({
+        "category": np.empty(0, dtype=object),
+        "description": np.empty(0, dtype=object),
+        "amount": np.empty(0, dtype=np.float64),
+        "year": np.empty(0, dtype=np.float64),
+    })
 
 
-def _safe_str(val: object) -> str:
-    """Coerce a cell value to str; NaN / None become empty string."""
-    if val is None:
-        return ""
-    try:
-        if pd.isna(val):
-            return ""
-    except (TypeError, ValueError):
-        pass
-    return str(val)
+def _items_df(items: list[dict], columns: tuple[str, ...]) -> pd.DataFrame:
+    """Build an editor table column-by-column from payload line items."""
+    return pd.DataFrame({c: [s[c] for s in items] for c in columns})
 
 
+@st.cache_data(max_entries=16)
 def _breakeven(schedule: pd.DataFrame) -> int | None:
-    for _, row in schedule.iterrows():
-        if row["cumulative_net_cf"] > 0:
-            return int(row["year"])
-    return None
+    cum = schedule["cumulative_net_cf"].to_numpy()
+    idx = int(np.argmax(cum > 0))
+    return int(schedule["year"].iat[idx]) if cum[idx] > 0 else None
+
+
+@st.cache_data(max_entries=16)
+def _build_net_cf_fig(schedule: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=schedule["year"], y=schedule["net_synergy_cf"],
+        mode="lines+markers", name="Net Synergy CF",
+        line=dict(width=2.5, color="#2c3e50"),
+    ))
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.4)
+    fig.update_layout(
+        title="Annual Net Synergy Cash Flow",
+        xaxis_title="Year", yaxis_title="$M",
+        height=360, margin=dict(t=40, b=30),
+    )
+    return fig
+
+
+@st.cache_data(max_entries=16)
+def _build_cum_cf_fig(schedule: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=schedule["year"], y=schedule["cumulative_net_cf"],
+        mode="lines+markers", fill="tozeroy",
+        name="Cumulative Net CF",
+        line=dict(width=2.5, color="#2980b9"),
+    ))
+    fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.4)
+    fig.update_layout(
+        title="Cumulative Net Synergy Cash Flow",
+        xaxis_title="Year", yaxis_title="$M",
+        height=360, margin=dict(t=40, b=30),
+    )
+    return fig
+
+
+@st.cache_data(max_entries=16)
+def _build_stacked_bar_fig(schedule: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=schedule["year"], y=schedule["gross_cost_synergies"],
+        name="Cost Synergies", marker_color="#2ecc71",
+    ))
+    fig.add_trace(go.Bar(
+        x=schedule["year"], y=schedule["gross_revenue_synergies"],
+        name="Revenue Synergies", marker_color="#3498db",
+    ))
+    fig.add_trace(go.Bar(
+        x=schedule["year"], y=-schedule["integration_costs"],
+        name="Integration Costs", marker_color="#e74c3c",
+    ))
+    fig.update_layout(
+        barmode="relative",
+        title="Annual Synergy Breakdown by Category",
+        xaxis_title="Year", yaxis_title="$M",
+        height=360, margin=dict(t=40, b=30),
+    )
+    return fig
+
+
+@st.cache_data(max_entries=16)
+def _schedule_csv(schedule: pd.DataFrame) -> bytes:
+    return schedule.to_csv(index=False, lineterminator="\n").encode()
+
+
+@st.cache_data(max_entries=16)
+def _summary_json(summary: dict) -> bytes:
+    return json.dumps(summary, indent=2).encode()
+
+
+@st.cache_data(ttl=5)
+def _cached_list_deals(limit: int = LIBRARY_PAGE_SIZE, offset: int = 0) -> list[dict]:
+    return db.list_deals(limit=limit, offset=offset)
+
+
+@st.cache_data(ttl=5)
+def _cached_count_deals() -> int:
+    return db.count_deals()
+
+
+def _clear_library_cache() -> None:
+    _cached_list_deals.clear()
+    _cached_count_deals.clear()
+
+
+def _synergy_items(df: pd.DataFrame, ramp_up: list[float] | None) -> list[dict]:
+    """Convert a synergy editor table to payload dicts, skipping incomplete rows."""
+    cat = df["category"].to_numpy()
+    desc = df["description"].fillna("").astype(str).to_numpy()
+    rr = df["run_rate"].to_numpy()
+    mask = ~(pd.isna(cat) | pd.isna(rr))
+    extra = {"ramp_up": ramp_up} if ramp_up is not None else {}
+    return [
+        {"category": c, "description": d, "run_rate": float(r), **extra}
+        for c, d, r in zip(cat[mask], desc[mask], rr[mask])
+    ]
 
 
 def _build_payload(
@@ -107,49 +208,26 @@ def _build_payload(
     """Assemble a DealInput-compatible dict from the current UI state."""
     ramp = RAMP_PRESETS[ramp_key]
 
-    cost_synergies: list[dict] = []
-    for _, r in cost_df.iterrows():
-        if pd.isna(r.get("category")) or pd.isna(r.get("run_rate")):
-            continue
-        item: dict = {
-            "category": r["category"],
-            "description": _safe_str(r.get("description")),
-            "run_rate": float(r["run_rate"]),
-        }
-        if ramp["cost"] is not None:
-            item["ramp_up"] = ramp["cost"]
-        cost_synergies.append(item)
-
-    rev_synergies: list[dict] = []
-    for _, r in rev_df.iterrows():
-        if pd.isna(r.get("category")) or pd.isna(r.get("run_rate")):
-            continue
-        item = {
-            "category": r["category"],
-            "description": _safe_str(r.get("description")),
-            "run_rate": float(r["run_rate"]),
+    cat = int_df["category"].to_numpy()
+    desc = int_df["description"].fillna("").astype(str).to_numpy()
+    amt = int_df["amount"].to_numpy()
+    yrs = int_df["year"].to_numpy()
+    mask = ~(pd.isna(cat) | pd.isna(amt))
+    int_costs = [
+        {
+            "category": c,
+            "description": d,
+            "amount": float(a),
+            "year": 1 if pd.isna(y) else int(y),
         }
-        if ramp["revenue"] is not None:
-            item["ramp_up"] = ramp["revenue"]
-        rev_synergies.append(item)
-
-    int_costs: list[dict] = []
-    for _, r in int_df.iterrows():
-        if pd.isna(r.get("category")) or pd.isna(r.get("amount")):
-            continue
-        yr = r.get("year", 1)
-        int_costs.append({
-            "category": r["category"],
-            "description": _safe_str(r.get("description")),
-            "amount": float(r["amount"]),
-            "year": 1 if pd.isna(yr) else int(yr),
-        })
+        for c, d, a, y in zip(cat[mask], desc[mask], amt[mask], yrs[mask])
+    ]
 
     return {
         "metadata": meta,
         "deal_terms": terms,
-        "cost_synergies": cost_synergies,
-        "revenue_synergies": rev_synergies,
+        "cost_synergies": _synergy_items(cost_df, ramp["cost"]),
+        "revenue_synergies": _synergy_items(rev_df, ramp["revenue"]),
         "integration_costs": int_costs,
     }
 
@@ -169,29 +247,22 @@ if "load_deal_payload" in st.session_state:
         "_dr": float(p["deal_terms"]["discount_rate"]),
         "_years": int(p["deal_terms"]["projection_years"]),
         "_cost_df": (
-            pd.DataFrame([
-                {"category": s["category"], "description": s["description"], "run_rate": s["run_rate"]}
-                for s in p["cost_synergies"]
-            ]) if p.get("cost_synergies") else _empty_cost_df()
+            _items_df(p["cost_synergies"], ("category", "description", "run_rate"))
+            if p.get("cost_synergies") else _empty_cost_df()
         ),
         "_rev_df": (
-            pd.DataFrame([
-                {"category": s["category"], "description": s["description"], "run_rate": s["run_rate"]}
-                for s in p["revenue_synergies"]
-            ]) if p.get("revenue_synergies") else _empty_rev_df()
+            _items_df(p["revenue_synergies"], ("category", "description", "run_rate"))
+            if p.get("revenue_synergies") else _empty_rev_df()
         ),
         "_int_df": (
-            pd.DataFrame([
-                {"category": s["category"], "description": s["description"],
-                 "amount": s["amount"], "year": s["year"]}
-                for s in p["integration_costs"]
-            ]) if p.get("integration_costs") else _empty_int_df()
+            _items_df(p["integration_costs"], ("category", "description", "amount", "year"))
+            if p.get("integration_costs") else _empty_int_df()
         ),
         "_loaded_msg": f"Loaded deal: {m['deal_name']}",
     })
     # Clear widget & result keys so they reinitialise on next render
     for k in ("cost_editor", "rev_editor", "int_editor",
-              "_result", "_memo_md", "_deal", "_payload", "_sens_df"):
+              "_result", "_memo_md", "_deal", "_sens_df"):
         st.session_state.pop(k, None)
     st.rerun()
 
@@ -330,12 +401,13 @@ with tab_builder:
         terms = {"enterprise_value": ev, "discount_rate": dr, "projection_years": years}
         payload = _build_payload(meta, terms, cost_df, rev_df, int_df, ramp_key)
         did = db.save_deal(payload, save_name or deal_name or "Untitled")
+        _clear_library_cache()
         st.success(f"Saved as **{save_name}** (ID {did})")
 
     # ── Run analysis ─────────────────────────────────────────────────────────
     if run_clicked:
         # Clear stale results
-        for k in ("_result", "_memo_md", "_deal", "_payload", "_sens_df"):
+        for k in ("_result", "_memo_md", "_deal", "_sens_df"):
             st.session_state.pop(k, None)
 
         meta  = {"deal_name": deal_name, "acquirer": acquirer, "target": target,
@@ -360,7 +432,6 @@ with tab_builder:
                 "_result": result,
                 "_memo_md": memo_md,
                 "_deal": deal_obj,
-                "_payload": payload,
             })
 
     # ── Display results (persisted in session state) ─────────────────────────
@@ -368,7 +439,7 @@ with tab_builder:
         result   = st.session_state["_result"]
         memo_md  = st.session_state["_memo_md"]
         deal_obj = st.session_state["_deal"]
-        schedule = result.synergy_schedule
+        schedule = result.synergy_schedule.as_dataframe
         summary  = result.summary
         be       = _breakeven(schedule)
 
@@ -376,14 +447,16 @@ with tab_builder:
         st.subheader("Results")
 
         # ── Warnings ─────────────────────────────────────────────────────────
-        for _, row in schedule.iterrows():
-            yr = int(row["year"])
-            if yr <= 2 and row["integration_costs"] > row["gross_total_synergies"]:
-                st.warning(
-                    f"Year {yr}: integration costs "
-                    f"(${row['integration_costs']:.1f}M) exceed gross synergies "
-                    f"(${row['gross_total_synergies']:.1f}M)"
-                )
+        yrs = schedule["year"].to_numpy()
+        ic = schedule["integration_costs"].to_numpy()
+        gs = schedule["gross_total_synergies"].to_numpy()
+        mask = (yrs <= 2) & (ic > gs)
+        for yr, ic_yr, gs_yr in zip(yrs[mask], ic[mask], gs[mask]):
+            st.warning(
+                f"Year {int(yr)}: integration costs "
+                f"(${ic_yr:.1f}M) exceed gross synergies "
+                f"(${gs_yr:.1f}M)"
+            )
         if be is None or be > deal_obj.deal_terms.projection_years:
             st.warning(
                 f"Cumulative net CF does not break even within the "
@@ -410,58 +483,9 @@ with tab_builder:
         st.subheader("Visuals")
         ch1, ch2 = st.columns(2)
 
-        with ch1:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=schedule["year"], y=schedule["net_synergy_cf"],
-                mode="lines+markers", name="Net Synergy CF",
-                line=dict(width=2.5, color="#2c3e50"),
-            ))
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.4)
-            fig.update_layout(
-                title="Annual Net Synergy Cash Flow",
-                xaxis_title="Year", yaxis_title="$M",
-                height=360, margin=dict(t=40, b=30),
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        with ch2:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=schedule["year"], y=schedule["cumulative_net_cf"],
-                mode="lines+markers", fill="tozeroy",
-                name="Cumulative Net CF",
-                line=dict(width=2.5, color="#2980b9"),
-            ))
-            fig.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.4)
-            fig.update_layout(
-                title="Cumulative Net Synergy Cash Flow",
-                xaxis_title="Year", yaxis_title="$M",
-                height=360, margin=dict(t=40, b=30),
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Stacked bar — full width
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=schedule["year"], y=schedule["gross_cost_synergies"],
-            name="Cost Synergies", marker_color="#2ecc71",
-        ))
-        fig.add_trace(go.Bar(
-            x=schedule["year"], y=schedule["gross_revenue_synergies"],
-            name="Revenue Synergies", marker_color="#3498db",
-        ))
-        fig.add_trace(go.Bar(
-            x=schedule["year"], y=-schedule["integration_costs"],
-            name="Integration Costs", marker_color="#e74c3c",
-        ))
-        fig.update_layout(
-            barmode="relative",
-            title="Annual Synergy Breakdown by Category",
-            xaxis_title="Year", yaxis_title="$M",
-            height=360, margin=dict(t=40, b=30),
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        ch1.plotly_chart(_build_net_cf_fig(schedule), use_container_width=True)
+        ch2.plotly_chart(_build_cum_cf_fig(schedule), use_container_width=True)
+        st.plotly_chart(_build_stacked_bar_fig(schedule), use_container_width=True)
 
         # ── Memo ─────────────────────────────────────────────────────────────
         with st.expander("Deal Memo (Markdown)"):
@@ -473,13 +497,13 @@ with tab_builder:
         dl1, dl2, dl3 = st.columns(3)
         dl1.download_button(
             "synergy_schedule.csv",
-            schedule.to_csv(index=False),
+            _schedule_csv(schedule),
             file_name="synergy_schedule.csv",
             mime="text/csv",
         )
         dl2.download_button(
             "summary.json",
-            json.dumps(summary, indent=2),
+            _summary_json(summary),
             file_name="summary.json",
             mime="application/json",
         )
@@ -504,31 +528,11 @@ with tab_builder:
         )
 
         if st.button("Compute Sensitivity Table"):
-            base_payload = st.session_state["_payload"]
             dr_vals = np.linspace(dr_pct[0] / 100.0, dr_pct[1] / 100.0, 5)
             m_vals  = np.linspace(mult_range[0], mult_range[1], 5)
 
-            rows: dict[str, dict] = {}
             with st.spinner("Computing sensitivity grid..."):
-                for m in m_vals:
-                    row: dict[str, float] = {}
-                    for d in dr_vals:
-                        adj = json.loads(json.dumps(base_payload))
-                        adj["deal_terms"]["discount_rate"] = round(float(d), 4)
-                        for s in adj.get("cost_synergies", []):
-                            s["run_rate"] = round(s["run_rate"] * float(m), 4)
-                        for s in adj.get("revenue_synergies", []):
-                            s["run_rate"] = round(s["run_rate"] * float(m), 4)
-                        try:
-                            adj_result = run_engine(DealInput(**adj))
-                            row[f"{d:.0%}"] = adj_result.summary["npv_net_synergies"]
-                        except Exception:
-                            row[f"{d:.0%}"] = float("nan")
-                    rows[f"{m:.1f}x"] = row
-
-            sens_df = pd.DataFrame(rows).T
-            sens_df.index.name = "Multiplier \\ Rate"
-            st.session_state["_sens_df"] = sens_df
+                st.session_state["_sens_df"] = sensitivity_grid(deal_obj, dr_vals, m_vals)
 
         if "_sens_df" in st.session_state:
             st.caption("NPV of Net Synergies ($M)")
@@ -544,37 +548,75 @@ with tab_builder:
 #  TAB 2 — DEAL LIBRARY
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab_library:
+def _copy_deal(deal_id: int, name: str) -> None:
+    loaded = db.load_deal(deal_id)
+    if loaded:
+        db.save_deal(loaded["payload"], f"{name} (copy)")
+        _clear_library_cache()
+
+
+def _delete_deal(deal_id: int) -> None:
+    db.delete_deal(deal_id)
+    _clear_library_cache()
+
+
+@st.fragment
+def _library_view() -> None:
+    """Deal Library body; widget interactions rerun only this fragment."""
     st.subheader("Saved Deals")
-    deals = db.list_deals()
-
-    if not deals:
-        st.info("No saved deals yet. Use the Deal Builder tab to create and save one.")
-    else:
-        # Header row
-        hc1, hc2, hc3, hc4 = st.columns([4, 2, 2, 3])
-        hc1.markdown("**Name**")
-        hc2.markdown("**Created**")
-        hc3.markdown("**Updated**")
-        hc4.markdown("**Actions**")
-
-        for d in deals:
-            c1, c2, c3, c4 = st.columns([4, 2, 2, 3])
-            c1.write(d["name"])
-            c2.caption(d["created_at"][:16])
-            c3.caption(d["updated_at"][:16])
-
-            bc1, bc2, bc3 = c4.columns(3)
-            if bc1.button("Load", key=f"load_{d['id']}", use_container_width=True):
-                loaded = db.load_deal(d["id"])
+    # st.tabs renders every tab on each rerun; only query and build the
+    # library widgets once the user asks for them.
+    show_library = st.toggle("Show saved deals", key="_show_library")
+
+    if show_library:
+        total = _cached_count_deals()
+        n_pages = max(1, -(-total // LIBRARY_PAGE_SIZE))
+        # Deletes can shrink the last page away; clamp before the widget is
+        # created so its stored value stays within bounds.
+        if st.session_state.get("_library_page", 1) > n_pages:
+            st.session_state["_library_page"] = n_pages
+        page = 1
+        if n_pages > 1:
+            page = st.number_input(
+                "Page", min_value=1, max_value=n_pages, step=1, key="_library_page",
+            )
+            st.caption(f"Page {page} of {n_pages} · {total} deals, most recently updated first.")
+        deals = _cached_list_deals(LIBRARY_PAGE_SIZE, (page - 1) * LIBRARY_PAGE_SIZE) if total else []
+
+        if not deals:
+            st.info("No saved deals yet. Use the Deal Builder tab to create and save one.")
+        else:
+            table = pd.DataFrame(deals)
+            st.dataframe(
+                pd.DataFrame({
+                    "Name": table["name"],
+                    "Created": table["created_at"].str[:16],
+                    "Updated": table["updated_at"].str[:16],
+                }),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+            names = dict(zip(table["id"].tolist(), table["name"].tolist()))
+            selected = st.selectbox(
+                "Select deal", list(names),
+                format_func=lambda i: f"{names[i]} (ID {i})",
+            )
+
+            bc1, bc2, bc3 = st.columns(3)
+            if bc1.button("Load", use_container_width=True):
+                loaded = db.load_deal(selected)
                 if loaded:
+                    # Loading repopulates the builder tab, so rerun the whole app.
                     st.session_state["load_deal_payload"] = loaded["payload"]
                     st.rerun()
-            if bc2.button("Copy", key=f"dup_{d['id']}", use_container_width=True):
-                loaded = db.load_deal(d["id"])
-                if loaded:
-                    db.save_deal(loaded["payload"], f"{d['name']} (copy)")
-                    st.rerun()
-            if bc3.button("Delete", key=f"del_{d['id']}", use_container_width=True):
-                db.delete_deal(d["id"])
-                st.rerun()
+            # Copy/Delete run as callbacks, before the fragment re-renders, so
+            # the listing above is already up to date without another rerun.
+            bc2.button("Copy", on_click=_copy_deal, args=(selected, names[selected]),
+                       use_container_width=True)
+            bc3.button("Delete", on_click=_delete_deal, args=(selected,),
+                       use_container_width=True)
+
+
+with tab_library:
+    _library_view()
@@ -4,12 +4,14 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import sys
 from pathlib import Path
 
 from pydantic import ValidationError
 
+from synergykit import _json
 from synergykit.schema import DealInput
 from synergykit.engine import run
 from synergykit.memo import generate
@@ -39,7 +41,7 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        raw = json.loads(input_path.read_text(encoding="utf-8"))
+        raw = _json.loads(input_path.read_bytes())
     except json.JSONDecodeError as e:
         print(f"Error: invalid JSON in {input_path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -58,14 +60,16 @@ def main() -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     csv_path = out_dir / "synergy_schedule.csv"
-    result.synergy_schedule.to_csv(csv_path, index=False)
+    result.synergy_schedule.as_dataframe.to_csv(csv_path, index=False)
 
     memo_path = out_dir / "deal_memo.md"
     memo_path.write_text(generate(deal, result), encoding="utf-8")
 
     summary_path = out_dir / "summary.csv"
-    import pandas as pd
-    pd.DataFrame([result.summary]).to_csv(summary_path, index=False)
+    with summary_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(result.summary), lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(result.summary)
 
     print(f"Done. Outputs written to {out_dir}/")
     print(f"  - {csv_path.name}   (annual synergy schedule)")
@@ -0,0 +1,27 @@
+"""JSON helpers — use orjson when it is installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def dumps(obj: object) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: str | bytes) -> object:
+    """Parse JSON from text or UTF-8 bytes.
+
+    Both backends raise a ``json.JSONDecodeError`` subclass on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
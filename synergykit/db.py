@@ -2,77 +2,137 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
 import sqlite3
+import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
+import zstandard as zstd
+
+from synergykit import _json
+
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "synergykit.db"
 
+ZSTD_LEVEL = 3
+
+# Statements are kept as constants so every call sends the identical string
+# and hits the connection's prepared-statement cache.
+SQL_INSERT = "INSERT INTO deals (name, payload, created_at, updated_at) VALUES (?, ?, ?, ?)"
+SQL_LIST = (
+    "SELECT id, name, created_at, updated_at FROM deals "
+    "ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+)
+SQL_COUNT = "SELECT COUNT(*) FROM deals"
+SQL_LOAD = "SELECT * FROM deals WHERE id = ?"
+SQL_DELETE = "DELETE FROM deals WHERE id = ?"
+
+
+def _pack(payload: dict) -> bytes:
+    """Serialize a deal payload to zstd-compressed JSON."""
+    return zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(_json.dumps(payload))
+
+
+def _unpack(blob: bytes | str) -> dict:
+    """Inverse of _pack; plain-text JSON from older databases is accepted too."""
+    if isinstance(blob, str):
+        return _json.loads(blob)
+    return _json.loads(zstd.ZstdDecompressor().decompress(blob))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_conn(db_path: str) -> tuple[sqlite3.Connection, threading.Lock]:
+    """Return a long-lived connection for *db_path* and the lock guarding it.
 
-def _connect(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db_path))
+    The connection is shared by every Streamlit session thread, so callers
+    must hold the lock for the whole execute/fetch/commit; use _locked_conn.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    return conn
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-8000")  # 8 MB page cache
+    return conn, threading.Lock()
+
+
+@contextlib.contextmanager
+def _locked_conn(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Yield the shared connection for *db_path* with its lock held."""
+    conn, lock = _get_conn(str(db_path))
+    with lock:
+        yield conn
 
 
 def init_db(db_path: Path = DEFAULT_DB_PATH) -> None:
-    """Create the deals table if it doesn't exist."""
-    conn = _connect(db_path)
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS deals (
-            id          INTEGER PRIMARY KEY AUTOINCREMENT,
-            name        TEXT NOT NULL,
-            payload     TEXT NOT NULL,
-            created_at  TEXT NOT NULL,
-            updated_at  TEXT NOT NULL
+    """Create the deals table and its indexes if they don't exist."""
+    with _locked_conn(db_path) as conn, conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS deals (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                name        TEXT NOT NULL,
+                payload     BLOB NOT NULL,
+                created_at  TEXT NOT NULL,
+                updated_at  TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deals_updated ON deals(updated_at DESC)"
         )
-        """
-    )
-    conn.commit()
-    conn.close()
+
+        # One-time migration: older databases stored payloads as text JSON.
+        legacy = conn.execute(
+            "SELECT id, payload FROM deals WHERE typeof(payload) = 'text'"
+        ).fetchall()
+        if legacy:
+            conn.executemany(
+                "UPDATE deals SET payload = ? WHERE id = ?",
+                [(_pack(_json.loads(r["payload"])), r["id"]) for r in legacy],
+            )
 
 
 def save_deal(deal_payload: dict, name: str, db_path: Path = DEFAULT_DB_PATH) -> int:
     """Insert a deal and return its row id."""
     now = datetime.now(timezone.utc).isoformat()
-    conn = _connect(db_path)
-    cur = conn.execute(
-        "INSERT INTO deals (name, payload, created_at, updated_at) VALUES (?, ?, ?, ?)",
-        (name, json.dumps(deal_payload), now, now),
-    )
-    conn.commit()
-    deal_id = cur.lastrowid
-    conn.close()
-    return deal_id
-
-
-def list_deals(db_path: Path = DEFAULT_DB_PATH) -> list[dict]:
-    """Return all deals (without full payload) ordered by most recent first."""
-    conn = _connect(db_path)
-    rows = conn.execute(
-        "SELECT id, name, created_at, updated_at FROM deals ORDER BY updated_at DESC"
-    ).fetchall()
-    conn.close()
+    blob = _pack(deal_payload)
+    with _locked_conn(db_path) as conn, conn:
+        return conn.execute(SQL_INSERT, (name, blob, now, now)).lastrowid
+
+
+def list_deals(
+    db_path: Path = DEFAULT_DB_PATH, limit: int = 100, offset: int = 0,
+) -> list[dict]:
+    """Return up to *limit* deals (without full payload), most recent first.
+
+    *offset* skips that many of the most recent deals, for paging.
+    """
+    with _locked_conn(db_path) as conn:
+        rows = conn.execute(SQL_LIST, (limit, offset)).fetchall()
     return [dict(r) for r in rows]
 
 
+def count_deals(db_path: Path = DEFAULT_DB_PATH) -> int:
+    """Return the number of saved deals."""
+    with _locked_conn(db_path) as conn:
+        (count,) = conn.execute(SQL_COUNT).fetchone()
+    return count
+
+
 def load_deal(deal_id: int, db_path: Path = DEFAULT_DB_PATH) -> dict | None:
-    """Load a single deal by id, parsing the JSON payload."""
-    conn = _connect(db_path)
-    row = conn.execute("SELECT * FROM deals WHERE id = ?", (deal_id,)).fetchone()
-    conn.close()
+    """Load a single deal by id, decompressing and parsing the payload."""
+    with _locked_conn(db_path) as conn:
+        row = conn.execute(SQL_LOAD, (deal_id,)).fetchone()
     if row is None:
         return None
     d = dict(row)
-    d["payload"] = json.loads(d["payload"])
+    d["payload"] = _unpack(d["payload"])
     return d
 
 
 def delete_deal(deal_id: int, db_path: Path = DEFAULT_DB_PATH) -> None:
     """Delete a deal by id."""
-    conn = _connect(db_path)
-    conn.execute("DELETE FROM deals WHERE id = ?", (deal_id,))
-    conn.commit()
-    conn.close()
+    with _locked_conn(db_path) as conn, conn:
+        conn.execute(SQL_DELETE, (deal_id,))
@@ -2,158 +2,232 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, fields, replace
 
-import numpy_financial as npf
+import numpy as np
 import pandas as pd
 
 from synergykit.schema import (
     DEFAULT_COST_RAMP,
     DEFAULT_REVENUE_RAMP,
     DealInput,
+    DealMetadata,
 )
 
 
-@dataclass
+@dataclass(eq=False)
+class Schedule:
+    """Year-by-year synergy breakdown, one read-only array per column."""
+
+    year: np.ndarray
+    gross_cost_synergies: np.ndarray
+    gross_revenue_synergies: np.ndarray
+    gross_total_synergies: np.ndarray
+    integration_costs: np.ndarray
+    net_synergy_cf: np.ndarray
+    cumulative_net_cf: np.ndarray
+
+    @functools.cached_property
+    def as_dataframe(self) -> pd.DataFrame:
+        """The schedule as a DataFrame (built on first access)."""
+        return pd.DataFrame({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class EngineResult:
     """Container for all computed outputs."""
 
-    synergy_schedule: pd.DataFrame   # Year-by-year synergy breakdown
-    summary: dict                    # Scalar summary metrics
+    synergy_schedule: Schedule   # Year-by-year synergy breakdown
+    summary: dict                # Scalar summary metrics
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class CompiledDeal:
+    """A deal reduced to plain arrays, for running many scenarios on one deal.
+
+    Build it once with ``DealInput.compile()``; derive scenarios with
+    ``dataclasses.replace`` (e.g. another discount_rate, or scaled run-rate
+    arrays) and pass them to ``run_compiled``, which never touches Pydantic.
+    """
+
+    metadata: DealMetadata
+    enterprise_value: float
+    discount_rate: float
+    projection_years: int
+    cost_run_rates: np.ndarray      # (n_cost,)
+    cost_ramps: np.ndarray          # (n_cost, years)
+    revenue_run_rates: np.ndarray   # (n_revenue,)
+    revenue_ramps: np.ndarray       # (n_revenue, years)
+    ic_years: np.ndarray            # (n_ic,), 1-indexed
+    ic_amounts: np.ndarray          # (n_ic,)
 
 
-def _expand_ramp(ramp: list[float], years: int) -> list[float]:
+def _expand_ramp(ramp: Sequence[float], years: int) -> np.ndarray:
     """Expand a ramp-up curve to cover the full projection period.
 
     If the ramp is shorter than projection_years, the last value is
     carried forward (i.e. run-rate is sustained). If longer, it is
-    truncated to match.
+    truncated to match. The returned array is shared and read-only.
     """
-    if len(ramp) >= years:
-        return ramp[:years]
-    return ramp + [ramp[-1]] * (years - len(ramp))
+    return _expand_ramp_cached(tuple(ramp), years)
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_ramp_cached(ramp: tuple[float, ...], years: int) -> np.ndarray:
+    expanded = np.pad(
+        np.asarray(ramp, dtype=np.float64),
+        (0, max(0, years - len(ramp))),
+        mode="edge",
+    )[:years]
+    expanded.setflags(write=False)
+    return expanded
+
+
+_RUN_CACHE_SIZE = 128
+_run_cache: OrderedDict[str, EngineResult] = OrderedDict()
+_run_cache_lock = threading.Lock()
 
 
 def run(deal: DealInput) -> EngineResult:
-    """Execute the synergy model and return computed results."""
+    """Execute the synergy model and return computed results.
+
+    Results are memoized on the deal's JSON form (the key only; the deal
+    itself is not re-validated). Schedule arrays are shared read-only; the
+    summary dict is copied per call.
+    """
+    key = deal.model_dump_json()
+    with _run_cache_lock:
+        cached = _run_cache.get(key)
+        if cached is not None:
+            _run_cache.move_to_end(key)
+
+    if cached is None:
+        cached = run_compiled(compile_deal(deal))
+        with _run_cache_lock:
+            _run_cache[key] = cached
+            if len(_run_cache) > _RUN_CACHE_SIZE:
+                _run_cache.popitem(last=False)
+
+    return EngineResult(
+        synergy_schedule=replace(cached.synergy_schedule),
+        summary=dict(cached.summary),
+    )
+
 
+def compile_deal(deal: DealInput) -> CompiledDeal:
+    """Convert a validated deal to its array form (see ``DealInput.compile``)."""
     years = deal.deal_terms.projection_years
-    year_labels = list(range(1, years + 1))
+    n_cost = len(deal.cost_synergies)
+    n_rev = len(deal.revenue_synergies)
+    n_ic = len(deal.integration_costs)
+
+    return CompiledDeal(
+        metadata=deal.metadata,
+        enterprise_value=deal.deal_terms.enterprise_value,
+        discount_rate=deal.deal_terms.discount_rate,
+        projection_years=years,
+        cost_run_rates=np.fromiter(
+            (s.run_rate for s in deal.cost_synergies), dtype=np.float64, count=n_cost,
+        ),
+        cost_ramps=np.array([
+            _expand_ramp(s.ramp_up or DEFAULT_COST_RAMP, years)
+            for s in deal.cost_synergies
+        ]).reshape(n_cost, years),
+        revenue_run_rates=np.fromiter(
+            (s.run_rate for s in deal.revenue_synergies), dtype=np.float64, count=n_rev,
+        ),
+        revenue_ramps=np.array([
+            _expand_ramp(s.ramp_up or DEFAULT_REVENUE_RAMP, years)
+            for s in deal.revenue_synergies
+        ]).reshape(n_rev, years),
+        ic_years=np.fromiter(
+            (ic.year for ic in deal.integration_costs), dtype=np.intp, count=n_ic,
+        ),
+        ic_amounts=np.fromiter(
+            (ic.amount for ic in deal.integration_costs), dtype=np.float64, count=n_ic,
+        ),
+    )
+
+
+def run_compiled(deal: CompiledDeal) -> EngineResult:
+    """Execute the synergy model on a compiled deal (not memoized)."""
+
+    years = deal.projection_years
+    cost_rr = deal.cost_run_rates
+    rev_rr = deal.revenue_run_rates
 
     # ------------------------------------------------------------------
-    # 1. Build gross synergy rows by category
+    # 1. Realized synergies per year
     # ------------------------------------------------------------------
 
-    rows: list[dict] = []
-
-    for item in deal.cost_synergies:
-        ramp = _expand_ramp(item.ramp_up or DEFAULT_COST_RAMP, years)
-        for y_idx, yr in enumerate(year_labels):
-            rows.append({
-                "year": yr,
-                "type": "cost",
-                "category": item.category.value,
-                "description": item.description,
-                "run_rate": item.run_rate,
-                "ramp_pct": ramp[y_idx],
-                "realized": item.run_rate * ramp[y_idx],
-            })
-
-    for item in deal.revenue_synergies:
-        ramp = _expand_ramp(item.ramp_up or DEFAULT_REVENUE_RAMP, years)
-        for y_idx, yr in enumerate(year_labels):
-            rows.append({
-                "year": yr,
-                "type": "revenue",
-                "category": item.category.value,
-                "description": item.description,
-                "run_rate": item.run_rate,
-                "ramp_pct": ramp[y_idx],
-                "realized": item.run_rate * ramp[y_idx],
-            })
-
-    detail = pd.DataFrame(rows)
+    # Weighted sums over items; an empty item list yields a zero vector.
+    cost_by_year = cost_rr @ deal.cost_ramps
+    revenue_by_year = rev_rr @ deal.revenue_ramps
 
     # ------------------------------------------------------------------
     # 2. Aggregate to annual schedule
     # ------------------------------------------------------------------
 
-    # Gross synergies per year (cost + revenue combined)
-    gross_by_year = detail.groupby("year")["realized"].sum()
-
-    # Gross by type per year
-    cost_by_year = (
-        detail[detail["type"] == "cost"]
-        .groupby("year")["realized"]
-        .sum()
-        .reindex(year_labels, fill_value=0.0)
-    )
-    revenue_by_year = (
-        detail[detail["type"] == "revenue"]
-        .groupby("year")["realized"]
-        .sum()
-        .reindex(year_labels, fill_value=0.0)
-    )
+    gross_by_year = cost_by_year + revenue_by_year
 
     # Integration costs per year
-    ic_by_year = pd.Series(0.0, index=year_labels)
-    for ic in deal.integration_costs:
-        ic_by_year[ic.year] += ic.amount
-
-    # Net synergy cash flow
-    net_cf = gross_by_year.reindex(year_labels, fill_value=0.0) - ic_by_year
+    ic_by_year = np.zeros(years, dtype=np.float64)
+    if deal.ic_years.size:
+        np.add.at(ic_by_year, deal.ic_years - 1, deal.ic_amounts)
 
-    # Cumulative net cash flow
-    cumulative_cf = net_cf.cumsum()
+    # Net synergy cash flow and its running total
+    net_cf = gross_by_year - ic_by_year
+    cumulative_cf = np.cumsum(net_cf)
 
     # ------------------------------------------------------------------
-    # 3. Build the schedule DataFrame
+    # 3. Build the schedule
     # ------------------------------------------------------------------
 
-    schedule = pd.DataFrame({
-        "year": year_labels,
-        "gross_cost_synergies": cost_by_year.values,
-        "gross_revenue_synergies": revenue_by_year.values,
-        "gross_total_synergies": (cost_by_year + revenue_by_year).values,
-        "integration_costs": ic_by_year.values,
-        "net_synergy_cf": net_cf.values,
-        "cumulative_net_cf": cumulative_cf.values,
-    })
+    schedule = Schedule(
+        year=np.arange(1, years + 1),
+        gross_cost_synergies=cost_by_year,
+        gross_revenue_synergies=revenue_by_year,
+        gross_total_synergies=gross_by_year,
+        integration_costs=ic_by_year,
+        net_synergy_cf=net_cf,
+        cumulative_net_cf=cumulative_cf,
+    )
+    for f in fields(schedule):
+        getattr(schedule, f.name).setflags(write=False)
 
     # ------------------------------------------------------------------
     # 4. NPV of net synergy cash flows
     # ------------------------------------------------------------------
 
-    r = deal.deal_terms.discount_rate
-    npv = float(npf.npv(r, [0.0] + list(net_cf.values)))  # year-0 = 0
+    r = deal.discount_rate
+    discount = (1.0 + r) ** np.arange(1, years + 1)  # year-0 cash flow is 0
+    npv = float((net_cf / discount).sum())
 
     # ------------------------------------------------------------------
     # 5. Summary metrics
     # ------------------------------------------------------------------
 
     total_integration = float(ic_by_year.sum())
-    total_run_rate = (
-        sum(s.run_rate for s in deal.cost_synergies)
-        + sum(s.run_rate for s in deal.revenue_synergies)
-    )
+    cost_rr_total = float(cost_rr.sum())
+    rev_rr_total = float(rev_rr.sum())
 
     summary = {
         "deal_name": deal.metadata.deal_name,
         "acquirer": deal.metadata.acquirer,
         "target": deal.metadata.target,
-        "enterprise_value": deal.deal_terms.enterprise_value,
+        "enterprise_value": deal.enterprise_value,
         "discount_rate": r,
         "projection_years": years,
-        "total_run_rate_synergies": total_run_rate,
-        "total_cost_synergy_run_rate": sum(
-            s.run_rate for s in deal.cost_synergies
-        ),
-        "total_revenue_synergy_run_rate": sum(
-            s.run_rate for s in deal.revenue_synergies
-        ),
+        "total_run_rate_synergies": cost_rr_total + rev_rr_total,
+        "total_cost_synergy_run_rate": cost_rr_total,
+        "total_revenue_synergy_run_rate": rev_rr_total,
         "total_integration_costs": total_integration,
         "npv_net_synergies": round(npv, 2),
-        "synergy_npv_as_pct_ev": round(npv / deal.deal_terms.enterprise_value * 100, 2),
+        "synergy_npv_as_pct_ev": round(npv / deal.enterprise_value * 100, 2),
     }
 
     return EngineResult(synergy_schedule=schedule, summary=summary)
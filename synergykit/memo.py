@@ -6,138 +6,82 @@ from synergykit.engine import EngineResult
 from synergykit.schema import DealInput
 
 
-def _fmt(value: float, decimals: int = 1) -> str:
-    """Format a number with commas and fixed decimals."""
-    return f"{value:,.{decimals}f}"
-
-
-def _pct(value: float) -> str:
-    """Format a decimal as a percentage string."""
-    return f"{value * 100:.0f}%"
-
-
 def _build_schedule_table(result: EngineResult) -> str:
     """Render the synergy schedule as a Markdown table."""
-    df = result.synergy_schedule
+    sched = result.synergy_schedule
     lines = [
         "| Year | Cost Synergies | Revenue Synergies | Gross Total | Integration Costs | Net Synergy CF | Cumulative CF |",
         "|-----:|---------------:|------------------:|------------:|------------------:|---------------:|--------------:|",
     ]
-    for _, row in df.iterrows():
-        lines.append(
-            f"| {int(row['year'])} "
-            f"| {_fmt(row['gross_cost_synergies'])} "
-            f"| {_fmt(row['gross_revenue_synergies'])} "
-            f"| {_fmt(row['gross_total_synergies'])} "
-            f"| {_fmt(row['integration_costs'])} "
-            f"| {_fmt(row['net_synergy_cf'])} "
-            f"| {_fmt(row['cumulative_net_cf'])} |"
+    lines.extend(
+        f"| {int(yr)} | {cost:,.1f} | {revenue:,.1f} | {gross:,.1f} "
+        f"| {ic:,.1f} | {net:,.1f} | {cum:,.1f} |"
+        for yr, cost, revenue, gross, ic, net, cum in zip(
+            sched.year,
+            sched.gross_cost_synergies,
+            sched.gross_revenue_synergies,
+            sched.gross_total_synergies,
+            sched.integration_costs,
+            sched.net_synergy_cf,
+            sched.cumulative_net_cf,
         )
+    )
     return "\n".join(lines)
 
 
-_CATEGORY_LABELS = {
-    "procurement": "Procurement",
-    "sga": "SG&A",
-    "cross_sell": "Cross-Sell",
-    "severance": "Severance",
-    "it_integration": "IT Integration",
-    "rebranding": "Rebranding",
-    "advisory_fees": "Advisory Fees",
-    "restructuring": "Restructuring",
-    "other": "Other",
-}
-
-
-def _label(category_value: str) -> str:
-    return _CATEGORY_LABELS.get(category_value, category_value.replace("_", " ").title())
-
-
 def _build_cost_synergy_detail(deal: DealInput) -> str:
     """List cost synergy line items."""
     if not deal.cost_synergies:
         return "_None._"
-    lines = []
-    for item in deal.cost_synergies:
-        lines.append(
-            f"- **{_label(item.category.value)}** — "
-            f"{item.description}: ${_fmt(item.run_rate)}M run-rate"
-        )
-    return "\n".join(lines)
+    return "\n".join([
+        f"- **{item.category_label}** — "
+        f"{item.description}: ${item.run_rate:,.1f}M run-rate"
+        for item in deal.cost_synergies
+    ])
 
 
 def _build_revenue_synergy_detail(deal: DealInput) -> str:
     """List revenue synergy line items."""
     if not deal.revenue_synergies:
         return "_None._"
-    lines = []
-    for item in deal.revenue_synergies:
-        lines.append(
-            f"- **{_label(item.category.value)}** — "
-            f"{item.description}: ${_fmt(item.run_rate)}M run-rate"
-        )
-    return "\n".join(lines)
+    return "\n".join([
+        f"- **{item.category_label}** — "
+        f"{item.description}: ${item.run_rate:,.1f}M run-rate"
+        for item in deal.revenue_synergies
+    ])
 
 
 def _build_integration_cost_detail(deal: DealInput) -> str:
     """List integration cost line items."""
     if not deal.integration_costs:
         return "_None._"
-    lines = []
-    for item in deal.integration_costs:
-        lines.append(
-            f"- **{_label(item.category.value)}** — "
-            f"{item.description}: ${_fmt(item.amount)}M (Year {item.year})"
-        )
-    return "\n".join(lines)
-
-
-def generate(deal: DealInput, result: EngineResult) -> str:
-    """Generate a Markdown deal memo from inputs and engine results."""
-
-    s = result.summary
-    ev = s["enterprise_value"]
-    npv = s["npv_net_synergies"]
-    pct_ev = s["synergy_npv_as_pct_ev"]
-    total_rr = s["total_run_rate_synergies"]
-    cost_rr = s["total_cost_synergy_run_rate"]
-    rev_rr = s["total_revenue_synergy_run_rate"]
-    total_ic = s["total_integration_costs"]
-    years = s["projection_years"]
-    rate = s["discount_rate"]
-
-    # Determine breakeven year from the schedule
-    schedule = result.synergy_schedule
-    breakeven_year = None
-    for _, row in schedule.iterrows():
-        if row["cumulative_net_cf"] > 0:
-            breakeven_year = int(row["year"])
-            break
+    return "\n".join([
+        f"- **{item.category_label}** — "
+        f"{item.description}: ${item.amount:,.1f}M (Year {item.year})"
+        for item in deal.integration_costs
+    ])
 
-    breakeven_text = (
-        f"Year {breakeven_year}" if breakeven_year
-        else f"beyond Year {years} (not reached within projection)"
-    )
 
-    memo = f"""# Deal Memo: {s['deal_name']}
+# Static memo body; generate() fills the named fields with str.format.
+_MEMO_TEMPLATE = """# Deal Memo: {deal_name}
 
-**Acquirer:** {s['acquirer']}
-**Target:** {s['target']}
-**Date:** {deal.metadata.date}
-**Analyst:** {deal.metadata.analyst or 'N/A'}
+**Acquirer:** {acquirer}
+**Target:** {target}
+**Date:** {date}
+**Analyst:** {analyst}
 
 ---
 
 ## Executive Summary
 
 This memo presents the estimated synergy potential for the proposed acquisition of
-{s['target']} by {s['acquirer']} at an enterprise value of ${_fmt(ev)}M.
+{target} by {acquirer} at an enterprise value of ${ev:,.1f}M.
 
-The analysis identifies **${_fmt(total_rr)}M in total run-rate synergies**
-(${_fmt(cost_rr)}M cost, ${_fmt(rev_rr)}M revenue), partially offset by
-**${_fmt(total_ic)}M in one-time integration costs**. Over a {years}-year
-projection, the net present value of synergy cash flows is **${_fmt(npv)}M**
-(discounted at {_pct(rate)}), representing **{pct_ev}% of enterprise value**.
+The analysis identifies **${total_rr:,.1f}M in total run-rate synergies**
+(${cost_rr:,.1f}M cost, ${rev_rr:,.1f}M revenue), partially offset by
+**${total_ic:,.1f}M in one-time integration costs**. Over a {years}-year
+projection, the net present value of synergy cash flows is **${npv:,.1f}M**
+(discounted at {rate:.0%}), representing **{pct_ev}% of enterprise value**.
 
 Cumulative net cash flow turns positive in **{breakeven_text}**.
 
@@ -145,31 +89,31 @@ Cumulative net cash flow turns positive in **{breakeven_text}**.
 
 ## Synergy Breakdown
 
-### Cost Synergies — ${_fmt(cost_rr)}M Run-Rate
+### Cost Synergies — ${cost_rr:,.1f}M Run-Rate
 
-{_build_cost_synergy_detail(deal)}
+{cost_detail}
 
 Cost synergies follow a standard ramp-up schedule, reaching full run-rate by
-Year {min(4, years)}.
+Year {full_ramp_year}.
 
-### Revenue Synergies — ${_fmt(rev_rr)}M Run-Rate
+### Revenue Synergies — ${rev_rr:,.1f}M Run-Rate
 
-{_build_revenue_synergy_detail(deal)}
+{revenue_detail}
 
 Revenue synergies are phased more conservatively, reflecting the execution
 risk inherent in cross-sell and market expansion initiatives.
 
 ---
 
-## Integration Costs — ${_fmt(total_ic)}M Total
+## Integration Costs — ${total_ic:,.1f}M Total
 
-{_build_integration_cost_detail(deal)}
+{integration_detail}
 
 ---
 
 ## Annual Net Synergy Cash Flow Schedule ($M)
 
-{_build_schedule_table(result)}
+{schedule_table}
 
 ---
 
@@ -177,11 +121,11 @@ risk inherent in cross-sell and market expansion initiatives.
 
 | Metric | Value |
 |:-------|------:|
-| Total Run-Rate Synergies | ${_fmt(total_rr)}M |
-| Total Integration Costs | ${_fmt(total_ic)}M |
-| Discount Rate | {_pct(rate)} |
+| Total Run-Rate Synergies | ${total_rr:,.1f}M |
+| Total Integration Costs | ${total_ic:,.1f}M |
+| Discount Rate | {rate:.0%} |
 | Projection Period | {years} years |
-| **NPV of Net Synergies** | **${_fmt(npv)}M** |
+| **NPV of Net Synergies** | **${npv:,.1f}M** |
 | NPV as % of EV | {pct_ev}% |
 | Cumulative Breakeven | {breakeven_text} |
 
@@ -195,7 +139,7 @@ risk inherent in cross-sell and market expansion initiatives.
    material customer attrition. These are subject to higher execution risk.
 3. **Integration costs** are estimated based on initial scoping; actual costs
    may vary depending on systems complexity and organizational alignment.
-4. This analysis uses a **single discount rate** ({_pct(rate)}) applied
+4. This analysis uses a **single discount rate** ({rate:.0%}) applied
    uniformly. A risk-adjusted approach (lower rate for cost synergies,
    higher for revenue) would provide additional precision.
 5. The model does **not** include accretion/dilution analysis, tax effects,
@@ -205,4 +149,46 @@ risk inherent in cross-sell and market expansion initiatives.
 
 *Generated by SynergyKit v0.1.0*
 """
-    return memo.strip() + "\n"
+
+
+def generate(deal: DealInput, result: EngineResult) -> str:
+    """Generate a Markdown deal memo from inputs and engine results."""
+
+    s = result.summary
+    years = s["projection_years"]
+
+    # Determine breakeven year from the schedule
+    schedule = result.synergy_schedule
+    positives = schedule.cumulative_net_cf > 0
+    if positives.any():
+        breakeven_year = int(schedule.year[positives.argmax()])
+    else:
+        breakeven_year = None
+
+    breakeven_text = (
+        f"Year {breakeven_year}" if breakeven_year
+        else f"beyond Year {years} (not reached within projection)"
+    )
+
+    return _MEMO_TEMPLATE.format(
+        deal_name=s["deal_name"],
+        acquirer=s["acquirer"],
+        target=s["target"],
+        date=deal.metadata.date,
+        analyst=deal.metadata.analyst or "N/A",
+        ev=s["enterprise_value"],
+        npv=s["npv_net_synergies"],
+        pct_ev=s["synergy_npv_as_pct_ev"],
+        total_rr=s["total_run_rate_synergies"],
+        cost_rr=s["total_cost_synergy_run_rate"],
+        rev_rr=s["total_revenue_synergy_run_rate"],
+        total_ic=s["total_integration_costs"],
+        years=years,
+        rate=s["discount_rate"],
+        full_ramp_year=min(4, years),
+        breakeven_text=breakeven_text,
+        cost_detail=_build_cost_synergy_detail(deal),
+        revenue_detail=_build_revenue_synergy_detail(deal),
+        integration_detail=_build_integration_cost_detail(deal),
+        schedule_table=_build_schedule_table(result),
+    )
@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
-from pydantic import BaseModel, Field, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+if TYPE_CHECKING:
+    from synergykit.engine import CompiledDeal
 
 
 # ---------------------------------------------------------------------------
 # Default IB-style ramp-up curves (% of run-rate realized each year)
 # ---------------------------------------------------------------------------
 
-DEFAULT_COST_RAMP = [0.25, 0.50, 0.75, 1.00]      # Year 1-4
-DEFAULT_REVENUE_RAMP = [0.00, 0.15, 0.40, 0.70]    # Year 1-4
+DEFAULT_COST_RAMP = np.asarray([0.25, 0.50, 0.75, 1.00])      # Year 1-4
+DEFAULT_REVENUE_RAMP = np.asarray([0.00, 0.15, 0.40, 0.70])    # Year 1-4
+DEFAULT_COST_RAMP.setflags(write=False)
+DEFAULT_REVENUE_RAMP.setflags(write=False)
 
 
 # ---------------------------------------------------------------------------
@@ -38,11 +45,44 @@ class IntegrationCostCategory(str, Enum):
     other = "other"
 
 
+_CATEGORY_LABELS = {
+    "procurement": "Procurement",
+    "sga": "SG&A",
+    "cross_sell": "Cross-Sell",
+    "severance": "Severance",
+    "it_integration": "IT Integration",
+    "rebranding": "Rebranding",
+    "advisory_fees": "Advisory Fees",
+    "restructuring": "Restructuring",
+    "other": "Other",
+}
+
+
+def _label(category_value: str) -> str:
+    return _CATEGORY_LABELS.get(category_value, category_value.replace("_", " ").title())
+
+
+def _check_ramp(ramp: Optional[tuple[float, ...]]) -> Optional[tuple[float, ...]]:
+    if ramp is not None and any(not 0.0 <= v <= 1.0 for v in ramp):
+        raise ValueError("ramp_up values must be fractions between 0 and 1.")
+    return ramp
+
+
 # ---------------------------------------------------------------------------
 # Synergy line items
 # ---------------------------------------------------------------------------
 
-class CostSynergy(BaseModel):
+class _LineItem(BaseModel):
+    """Base for line items; caches the category's display label."""
+
+    model_config = ConfigDict(frozen=True)
+
+    @cached_property
+    def category_label(self) -> str:
+        return _label(self.category.value)
+
+
+class CostSynergy(_LineItem):
     """A single cost-synergy line item."""
 
     category: CostSynergyCategory
@@ -52,7 +92,7 @@ class CostSynergy(BaseModel):
         gt=0,
         description="Annual run-rate value in $M once fully realized.",
     )
-    ramp_up: Optional[list[float]] = Field(
+    ramp_up: Optional[tuple[float, ...]] = Field(
         default=None,
         description=(
             "Custom ramp-up curve as list of fractions (0-1) per year. "
@@ -60,8 +100,10 @@ class CostSynergy(BaseModel):
         ),
     )
 
+    _validate_ramp = field_validator("ramp_up")(_check_ramp)
+
 
-class RevenueSynergy(BaseModel):
+class RevenueSynergy(_LineItem):
     """A single revenue-synergy line item."""
 
     category: RevenueSynergyCategory
@@ -71,7 +113,7 @@ class RevenueSynergy(BaseModel):
         gt=0,
         description="Annual run-rate value in $M once fully realized.",
     )
-    ramp_up: Optional[list[float]] = Field(
+    ramp_up: Optional[tuple[float, ...]] = Field(
         default=None,
         description=(
             "Custom ramp-up curve as list of fractions (0-1) per year. "
@@ -79,8 +121,10 @@ class RevenueSynergy(BaseModel):
         ),
     )
 
+    _validate_ramp = field_validator("ramp_up")(_check_ramp)
 
-class IntegrationCost(BaseModel):
+
+class IntegrationCost(_LineItem):
     """A one-time integration cost item."""
 
     category: IntegrationCostCategory
@@ -104,6 +148,8 @@ class IntegrationCost(BaseModel):
 class DealTerms(BaseModel):
     """Core deal parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     enterprise_value: float = Field(
         ...,
         gt=0,
@@ -126,6 +172,8 @@ class DealTerms(BaseModel):
 class DealMetadata(BaseModel):
     """Descriptive information for the deal memo header."""
 
+    model_config = ConfigDict(frozen=True)
+
     deal_name: str = Field(..., min_length=1)
     acquirer: str = Field(..., min_length=1)
     target: str = Field(..., min_length=1)
@@ -163,3 +211,13 @@ class DealInput(BaseModel):
                     f"but projection_years is {years}."
                 )
         return self
+
+    def compile(self) -> CompiledDeal:
+        """Return the array form consumed by ``engine.run_compiled``.
+
+        Use it for sweeps over one deal: validation and ramp expansion
+        happen once here rather than on every run.
+        """
+        from synergykit.engine import compile_deal  # engine imports this module
+
+        return compile_deal(self)
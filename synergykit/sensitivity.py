@@ -0,0 +1,92 @@
+"""Sensitivity analysis — NPV grid over discount rates and run-rate multipliers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from synergykit.schema import DealInput
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python loops
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(
+    "f8[:,:](f8[:], f8[:], f8[:], f8[:], f8[:], i8[:], f8[:], f8[:], i8)",
+    cache=True,
+)
+def npv_grid(cost_rr, rev_rr, cost_ramp, rev_ramp,
+             int_amounts, int_years, dr_vals, m_vals, years):
+    """Compute NPV of net synergy cash flows for every (multiplier, rate) pair.
+
+    Run-rates are scaled by each multiplier; integration costs are not.
+    Returns an array of shape ``(len(m_vals), len(dr_vals))``.
+    """
+    cost_total = cost_rr.sum()
+    rev_total = rev_rr.sum()
+
+    gross = np.zeros(years)
+    for t in range(years):
+        gross[t] = cost_total * cost_ramp[t] + rev_total * rev_ramp[t]
+
+    ic = np.zeros(years)
+    for k in range(int_amounts.shape[0]):
+        ic[int_years[k] - 1] += int_amounts[k]
+
+    out = np.empty((m_vals.shape[0], dr_vals.shape[0]))
+    for i in range(m_vals.shape[0]):
+        m = m_vals[i]
+        for j in range(dr_vals.shape[0]):
+            step = 1.0 / (1.0 + dr_vals[j])
+            discount = 1.0
+            npv = 0.0
+            for t in range(years):
+                discount *= step  # (1 + dr) ** -(t + 1)
+                npv += (m * gross[t] - ic[t]) * discount
+            out[i, j] = npv
+    return out
+
+
+def _weighted_ramp(run_rates: np.ndarray, ramps: np.ndarray) -> np.ndarray:
+    """Collapse per-item ramps (one row each) into one run-rate-weighted curve.
+
+    ``run_rates.sum() * ramp[t]`` equals the sum of each item's realized
+    synergy in year ``t``, so the kernel only needs a single ramp per type.
+    """
+    total = run_rates.sum()
+    if total == 0.0:
+        return np.zeros(ramps.shape[1])
+    return run_rates @ ramps / total
+
+
+def sensitivity_grid(
+    deal: DealInput,
+    dr_vals: np.ndarray,
+    m_vals: np.ndarray,
+) -> pd.DataFrame:
+    """Return NPV ($M) by run-rate multiplier (rows) and discount rate (columns)."""
+    compiled = deal.compile()
+
+    cost_ramp = _weighted_ramp(compiled.cost_run_rates, compiled.cost_ramps)
+    rev_ramp = _weighted_ramp(compiled.revenue_run_rates, compiled.revenue_ramps)
+    int_years = compiled.ic_years.astype(np.int64, copy=False)
+
+    dr_vals = np.ascontiguousarray(dr_vals, dtype=np.float64)
+    m_vals = np.ascontiguousarray(m_vals, dtype=np.float64)
+
+    grid = npv_grid(compiled.cost_run_rates, compiled.revenue_run_rates,
+                    cost_ramp, rev_ramp, compiled.ic_amounts, int_years,
+                    dr_vals, m_vals, compiled.projection_years)
+
+    sens_df = pd.DataFrame(
+        grid.round(2),
+        index=[f"{m:.1f}x" for m in m_vals],
+        columns=[f"{d:.0%}" for d in dr_vals],
+    )
+    sens_df.index.name = "Multiplier \\ Rate"
+    return sens_df